@@ -11,18 +11,37 @@ Usage:
 """
 
 import argparse
+import functools
 import json
+import multiprocessing as mp
+import os
+import pickle
 import sys
 import time
+from concurrent.futures import (ProcessPoolExecutor, ThreadPoolExecutor,
+                                TimeoutError as FuturesTimeout, as_completed)
 from datetime import datetime
 from typing import Optional
 from pathlib import Path
 
+import human_eval.data
 from human_eval.data import read_problems
 from human_eval.execution import check_correctness
 
-# Deterministic subset for quick benchmarks
-QUICK_SUBSET = [
+try:
+    import orjson  # C-extension serializer, much faster on full-tier payloads
+except ImportError:
+    orjson = None
+
+PROBLEMS_CACHE = Path("~/.cache/amcp/humaneval.pkl").expanduser()
+
+# Hard deadline for collecting one evaluation from a pool worker; well above
+# check_correctness's own per-run timeout so it only fires on wedged workers
+EXEC_DEADLINE = 60.0
+
+# Deterministic subsets for quick benchmarks; immutable tuples so the
+# module-level constants are hashable and allocated once
+QUICK_SUBSET: tuple[str, ...] = (
     "HumanEval/0",   # has_close_elements
     "HumanEval/1",   # separate_paren_groups
     "HumanEval/2",   # truncate_number
@@ -33,9 +52,9 @@ QUICK_SUBSET = [
     "HumanEval/8",   # sum_product
     "HumanEval/9",   # rolling_max
     "HumanEval/10",  # make_palindrome
-]
+)
 
-STANDARD_SUBSET = QUICK_SUBSET + [
+STANDARD_SUBSET: tuple[str, ...] = QUICK_SUBSET + (
     "HumanEval/11",  # string_xor
     "HumanEval/12",  # longest
     "HumanEval/13",  # greatest_common_divisor
@@ -56,10 +75,10 @@ STANDARD_SUBSET = QUICK_SUBSET + [
     "HumanEval/28",  # concatenate
     "HumanEval/29",  # filter_by_prefix
     "HumanEval/30",  # get_positive
-]
+)
 
 # Brutal: Known hard problems that LLMs frequently fail
-BRUTAL_SUBSET = [
+BRUTAL_SUBSET: tuple[str, ...] = (
     "HumanEval/129",  # minPath - k-length minimum path in grid
     "HumanEval/109",  # move_one_ball - sorted array rotation check
     "HumanEval/68",   # pluck - smallest even with index
@@ -70,7 +89,38 @@ BRUTAL_SUBSET = [
     "HumanEval/93",   # encode - swap case + vowel shift
     "HumanEval/91",   # is_bored - sentence parsing for "I" starts
     "HumanEval/84",   # solve - digit sum to binary
-]
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _load_problems_cached() -> dict:
+    """Load HumanEval problems, caching the parsed dict on disk.
+
+    read_problems() re-parses the shipped gz JSONL on every call; across
+    repeated benchmark runs that's wasted I/O + JSON decoding. Keep a pickle
+    under ~/.cache/amcp invalidated by the source file's mtime, and an
+    lru_cache on top so repeated in-process calls are O(1).
+    """
+    src = Path(human_eval.data.HUMAN_EVAL)
+    try:
+        if PROBLEMS_CACHE.exists() and PROBLEMS_CACHE.stat().st_mtime >= src.stat().st_mtime:
+            with open(PROBLEMS_CACHE, "rb") as f:
+                return pickle.load(f)
+    except (OSError, pickle.PickleError, ValueError, EOFError):
+        pass  # stale/truncated/unreadable cache — fall through to a fresh parse
+
+    problems = read_problems()
+    try:
+        PROBLEMS_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        # Write via temp file + atomic rename so an interrupted run can't
+        # leave a truncated pickle behind
+        tmp = PROBLEMS_CACHE.with_suffix(".pkl.tmp")
+        with open(tmp, "wb") as f:
+            pickle.dump(problems, f, protocol=5)
+        os.replace(tmp, PROBLEMS_CACHE)
+    except OSError:
+        pass  # cache is best-effort
+    return problems
 
 
 def load_solutions(solutions_file: str) -> dict[str, str]:
@@ -79,6 +129,55 @@ def load_solutions(solutions_file: str) -> dict[str, str]:
         return json.load(f)
 
 
+# Worker-side copies of the problem/solution dicts, installed once per worker
+# by the pool initializer (COW-shared with the parent under fork) so each task
+# ships only its task_id over IPC instead of re-pickling prompt/test payloads
+_PROBLEMS: dict = {}
+_SOLUTIONS: dict = {}
+
+
+def _warm_worker_init(problems: dict, solutions: dict):
+    """Install shared task data and pay the human_eval import cost once per
+    pool worker, not per task."""
+    global _PROBLEMS, _SOLUTIONS
+    _PROBLEMS = problems
+    _SOLUTIONS = solutions
+    import human_eval.execution  # noqa: F401
+
+
+def _make_exec_pool(problems: dict, solutions: dict,
+                    max_workers: Optional[int] = None) -> ProcessPoolExecutor:
+    """Build the persistent execute-stage pool.
+
+    Workers are warm — interpreter startup and the human_eval import are paid
+    once per worker instead of once per task — and must be non-daemonic:
+    check_correctness spawns a Manager and a sandbox Process per call, which
+    multiprocessing.Pool's daemonic workers are forbidden to do. A
+    ProcessPoolExecutor provides that while still supporting
+    initializer/initargs for the shared problem data.
+    """
+    if "fork" in mp.get_all_start_methods():
+        mp_ctx = mp.get_context("fork")  # COW-shares parent memory on Linux
+    else:
+        mp_ctx = None
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=mp_ctx,
+                               initializer=_warm_worker_init,
+                               initargs=(problems, solutions))
+
+
+def _eval_one(task_id: str) -> dict:
+    """Top-level (picklable) adapter for pool workers; reads the problem and
+    solution from the initializer-installed dicts instead of the IPC payload."""
+    problem = _PROBLEMS[task_id]
+    return evaluate_solution(
+        task_id,
+        problem["prompt"],
+        _SOLUTIONS[task_id],
+        problem["test"],
+        problem["entry_point"],
+    )
+
+
 def evaluate_solution(
     task_id: str,
     prompt: str,
@@ -88,9 +187,6 @@ def evaluate_solution(
     timeout: float = 5.0
 ) -> dict:
     """Evaluate a single solution."""
-    # Combine prompt and solution
-    full_code = prompt + solution
-    
     # Run tests
     start_time = time.time()
     result = check_correctness(
@@ -111,11 +207,22 @@ def evaluate_solution(
 def run_benchmark(
     solutions: dict[str, str],
     problem_ids: Optional[list[str]] = None,
-    tier: str = "quick"
+    tier: str = "quick",
+    n_jobs_prepare: Optional[int] = None,
+    n_jobs_exec: Optional[int] = None
 ) -> dict:
-    """Run benchmark and return structured results."""
-    
-    problems = read_problems()
+    """Run benchmark and return structured results.
+
+    Evaluation runs in two independently sized stages: a lightweight
+    "prepare" stage (dict lookups, NO_SOLUTION handling) on a thread pool,
+    feeding a heavy "execute" stage on a process pool. Prepared work items
+    keep the exec pool saturated instead of head-of-line blocking behind
+    problems that turn out to have no solution. check_correctness sandboxes
+    each run in its own subprocess, so the exec stage is embarrassingly
+    parallel and processes sidestep the GIL during result aggregation.
+    """
+
+    problems = _load_problems_cached()
     
     # Determine which problems to run
     if problem_ids:
@@ -129,43 +236,85 @@ def run_benchmark(
     else:  # full
         ids_to_run = list(problems.keys())
     
-    results = []
+    results_by_id = {}
     passed = 0
     failed = 0
     skipped = 0
-    
-    for task_id in ids_to_run:
+
+    def _prepare(task_id: str):
+        """Stage 1: resolve a task id to a runnable verdict. Workers look the
+        problem data up themselves from the initializer-shared dicts."""
         if task_id not in problems:
-            print(f"Warning: {task_id} not found in problems", file=sys.stderr)
-            skipped += 1
-            continue
-            
+            return ("missing", task_id)
         if task_id not in solutions:
-            print(f"Warning: No solution for {task_id}", file=sys.stderr)
-            results.append({
-                "task_id": task_id,
-                "passed": False,
-                "result": "NO_SOLUTION",
-                "time_seconds": 0,
-            })
-            failed += 1
-            continue
-        
-        problem = problems[task_id]
-        result = evaluate_solution(
-            task_id=task_id,
-            prompt=problem["prompt"],
-            solution=solutions[task_id],
-            test=problem["test"],
-            entry_point=problem["entry_point"]
-        )
-        
-        results.append(result)
-        if result["passed"]:
-            passed += 1
-        else:
-            failed += 1
-    
+            return ("no_solution", task_id)
+        return ("run", task_id)
+
+    n_prep = n_jobs_prepare or 4
+    n_exec = n_jobs_exec or os.cpu_count()
+
+    with ThreadPoolExecutor(max_workers=n_prep) as prep_pool, \
+            _make_exec_pool(problems, solutions, max_workers=n_exec) as exec_pool:
+        prep_futures = [prep_pool.submit(_prepare, task_id) for task_id in ids_to_run]
+
+        # Settle all verdicts in the main thread before feeding the exec
+        # pool: the pool consumes its input iterable from an internal
+        # task-handler thread, so the feed must stay side-effect-free —
+        # counter updates from there would race the collection loop below
+        runnable = []
+        for prep_future in as_completed(prep_futures):
+            verdict, task_id = prep_future.result()
+            if verdict == "missing":
+                print(f"Warning: {task_id} not found in problems", file=sys.stderr)
+                skipped += 1
+                continue
+            if verdict == "no_solution":
+                print(f"Warning: No solution for {task_id}", file=sys.stderr)
+                results_by_id[task_id] = {
+                    "task_id": task_id,
+                    "passed": False,
+                    "result": "NO_SOLUTION",
+                    "time_seconds": 0,
+                }
+                failed += 1
+                continue
+            runnable.append(task_id)
+
+        pending = [(task_id, exec_pool.submit(_eval_one, task_id))
+                   for task_id in runnable]
+
+        # Collect per task, in submission order (workers complete roughly in
+        # that order, so later futures are usually already done when reached).
+        # Each task resolves individually: a wedged or crashed worker costs
+        # its own task a TIMEOUT/ERROR verdict, never the rest of the run.
+        for task_id, future in pending:
+            try:
+                # check_correctness enforces its own timeout; this deadline
+                # only catches a wedged worker
+                result = future.result(timeout=EXEC_DEADLINE)
+            except FuturesTimeout:
+                result = {
+                    "task_id": task_id,
+                    "passed": False,
+                    "result": "TIMEOUT",
+                    "time_seconds": EXEC_DEADLINE,
+                }
+            except Exception as e:
+                result = {
+                    "task_id": task_id,
+                    "passed": False,
+                    "result": f"ERROR: {type(e).__name__}: {e}",
+                    "time_seconds": 0,
+                }
+            results_by_id[task_id] = result
+            if result["passed"]:
+                passed += 1
+            else:
+                failed += 1
+
+    # Emit in the requested (deterministic) task order
+    results = [results_by_id[tid] for tid in ids_to_run if tid in results_by_id]
+
     total = passed + failed
     accuracy = passed / total if total > 0 else 0
     
@@ -192,7 +341,13 @@ def main():
     parser.add_argument("--output", help="Output JSON file (default: stdout)")
     parser.add_argument("--tier", choices=["quick", "standard", "brutal", "full"], default="quick")
     parser.add_argument("--problem-ids", help="Comma-separated problem IDs to run")
-    
+    parser.add_argument("--n-jobs-prepare", type=int,
+                        help="Workers for the prepare stage (default: 4)")
+    parser.add_argument("--n-jobs-exec", type=int,
+                        help="Workers for the execute stage (default: cpu count)")
+    parser.add_argument("--jobs", type=int,
+                        help="Shorthand for --n-jobs-exec")
+
     args = parser.parse_args()
     
     solutions = load_solutions(args.solutions)
@@ -201,16 +356,21 @@ def main():
     if args.problem_ids:
         problem_ids = [p.strip() for p in args.problem_ids.split(",")]
     
-    results = run_benchmark(solutions, problem_ids=problem_ids, tier=args.tier)
-    
-    output = json.dumps(results, indent=2)
+    results = run_benchmark(solutions, problem_ids=problem_ids, tier=args.tier,
+                            n_jobs_prepare=args.n_jobs_prepare,
+                            n_jobs_exec=args.n_jobs_exec or args.jobs)
     
+    if orjson is not None:
+        output = orjson.dumps(results, option=orjson.OPT_INDENT_2)
+    else:
+        output = json.dumps(results, indent=2).encode("utf-8")
+
     if args.output:
-        with open(args.output, "w") as f:
+        with open(args.output, "wb") as f:
             f.write(output)
         print(f"Results written to {args.output}", file=sys.stderr)
     else:
-        print(output)
+        sys.stdout.buffer.write(output + b"\n")
 
 
 if __name__ == "__main__":
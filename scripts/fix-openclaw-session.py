@@ -65,64 +65,202 @@ USAGE
     python3 fix-openclaw-session.py --all-agents
 """
 
+import hashlib
 import json
 import glob
+import mmap
+import pickle
+import re
 import shutil
+import subprocess
 import sys
 import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from collections import defaultdict
 
+try:
+    import orjson  # ~3-5x faster than stdlib json and parses bytes directly
+except ImportError:
+    orjson = None
+
+try:
+    import ahocorasick  # multi-pattern scan in one pass over each string
+except ImportError:
+    ahocorasick = None
+
 # ── Defaults ──────────────────────────────────────────────────────────────────
 
 OPENCLAW_DIR = os.path.expanduser("~/.openclaw")
 DEFAULT_SESSIONS_DIR = os.path.join(OPENCLAW_DIR, "agents", "main", "sessions")
 
+# Analysis reports are cached on disk keyed by (schema, mtime_ns, size) so
+# re-running a dry scan over a large agents tree only re-parses files that
+# actually changed. Bump CACHE_SCHEMA whenever the report shape changes.
+REPORT_CACHE_DIR = Path("~/.cache/amcp/session-reports").expanduser()
+CACHE_SCHEMA = 1
+
 TOOL_CALL_TYPES = {"toolCall", "toolUse", "functionCall"}
 TOOL_RESULT_ROLES = {"toolResult", "tool_result"}
 
+# Fast pre-filter over raw bytes: a line that contains none of the corruption
+# markers (nor any tool_call/tool_result machinery) can never be classified as
+# corrupt, so it bypasses JSON parsing entirely. Most transcripts are ~99%
+# clean lines, making this the difference between parsing everything and
+# parsing almost nothing.
+FAST_CORRUPT = re.compile(
+    rb'"stopReason"\s*:\s*"error"|"partialJson"|"errorMessage"'
+    rb'|"tool_result"|"toolResult"|"toolCall"|"toolUse"|"functionCall"'
+)
+
+# Minimal field extraction for pre-filtered lines: the parent DAG still needs
+# every entry's id/parentId
+FAST_ID = re.compile(rb'"id"\s*:\s*"([^"]*)"')
+FAST_PARENT = re.compile(rb'"parentId"\s*:\s*"([^"]*)"')
+
+# Sentinel obj for lines the pre-filter proved clean (never parsed)
+_SKIP = {}
+
 
 # ── Helpers ───────────────────────────────────────────────────────────────────
 
-def parse_jsonl(filepath: str) -> list[tuple[int, dict | None, str]]:
-    """Parse a JSONL file. Returns list of (line_number, parsed_obj, raw_line)."""
-    entries = []
+@dataclass(slots=True)
+class Entry:
+    """One transcript line with its hot fields flattened out once at parse.
+
+    Analysis and fixing used to re-derive id/parent/role/stopReason from the
+    nested message dict on every check (each a chain of dict.get calls plus
+    throwaway empty-dict defaults). Precomputing them here turns those into
+    plain attribute reads, and slots=True drops the per-instance __dict__ —
+    noticeable across hundreds of thousands of entries.
+    """
+    lineno: int
+    obj: dict | None
+    raw: bytes
+    oid: str = ""
+    parent: str = ""
+    role: str | None = None
+    stop: str | None = None
+    err: str = ""
+    content: object = None
+    tool_result_id: str | None = None
+
+    @classmethod
+    def from_line(cls, lineno: int, obj: dict | None, raw: bytes) -> "Entry":
+        e = cls(lineno, obj, raw)
+        if obj is None:
+            return e
+        e.oid = obj.get("id", "")
+        e.parent = obj.get("parentId", "")
+        msg = obj.get("message")
+        if isinstance(msg, dict):
+            e.role = msg.get("role")
+            e.stop = msg.get("stopReason")
+            e.err = msg.get("errorMessage", "")
+            e.content = msg.get("content")
+            if e.role in TOOL_RESULT_ROLES:
+                e.tool_result_id = msg.get("toolCallId") or msg.get("toolUseId") or None
+        return e
+
+
+def _entry_from_raw(i: int, raw: bytes) -> Entry:
+    """Classify one raw line into an Entry, skipping the parse when the
+    bytes pre-filter proves the line clean."""
+    # The brace check keeps obviously-non-JSON lines on the parse path so
+    # they are still reported as unparseable
+    if (raw.startswith(b"{") and raw.endswith(b"}")
+            and not FAST_CORRUPT.search(raw)):
+        # Definitely clean — skip the parse, keep id/parentId for the DAG
+        # via the lightweight regexes
+        entry = Entry(i, _SKIP, raw)
+        m = FAST_ID.search(raw)
+        if m:
+            entry.oid = m.group(1).decode("utf-8", "replace")
+        m = FAST_PARENT.search(raw)
+        if m:
+            entry.parent = m.group(1).decode("utf-8", "replace")
+        return entry
     try:
-        with open(filepath, "r", encoding="utf-8") as f:
-            for i, raw in enumerate(f, start=1):
-                raw = raw.rstrip("\n")
-                if not raw:
-                    continue
-                try:
-                    obj = json.loads(raw)
-                except json.JSONDecodeError:
-                    obj = None
-                entries.append((i, obj, raw))
+        obj = (orjson.loads if orjson else json.loads)(raw)
+    except ValueError:
+        obj = None
+    return Entry.from_line(i, obj, raw)
+
+
+def _iter_parsed(filepath: str):
+    """Yield an Entry per JSONL line, lazily.
+
+    The file is memory-mapped and split on newlines: the kernel pages bytes
+    in on demand, Python's buffered line iteration is bypassed, and orjson
+    parses the slices directly. raw stays bytes; callers decode only when
+    they actually emit text.
+    """
+    try:
+        with open(filepath, "rb") as f:
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                return  # empty file
+            try:
+                size = len(mm)
+                start = 0
+                i = 0
+                while start < size:
+                    end = mm.find(b"\n", start)
+                    if end == -1:
+                        end = size
+                    i += 1
+                    raw = mm[start:end].rstrip(b"\r")
+                    start = end + 1
+                    if not raw:
+                        continue
+                    yield _entry_from_raw(i, raw)
+            finally:
+                mm.close()
     except (OSError, IOError) as e:
         print(f"  WARNING: Could not read {filepath}: {e}", file=sys.stderr)
-    return entries
 
 
-def get_role(obj: dict) -> str | None:
-    msg = obj.get("message")
-    if isinstance(msg, dict):
-        return msg.get("role")
-    return None
+def parse_jsonl(filepath: str) -> list[Entry]:
+    """Parse a JSONL file into a list of Entry records."""
+    return list(_iter_parsed(filepath))
+
+
+def make_id_matcher(ids: set[str]):
+    """Build a matcher(text) -> matched id | None for a set of tool_call IDs.
+
+    Scanning each errorMessage once per poisoned id is O(N*M*|err|); an
+    Aho-Corasick automaton (or a compiled regex alternation as fallback)
+    finds any of the ids in a single pass over the text.
+    """
+    if not ids:
+        return lambda text: None
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for tc_id in ids:
+            automaton.add_word(tc_id, tc_id)
+        automaton.make_automaton()
+
+        def match(text: str) -> str | None:
+            hit = next(automaton.iter(text), None)
+            return hit[1] if hit else None
 
+        return match
 
-def get_id(obj: dict) -> str:
-    return obj.get("id", "")
+    pattern = re.compile("|".join(map(re.escape, sorted(ids))))
 
+    def match(text: str) -> str | None:
+        m = pattern.search(text)
+        return m.group(0) if m else None
 
-def get_parent_id(obj: dict) -> str:
-    return obj.get("parentId", "")
+    return match
 
 
-def extract_tool_call_ids(obj: dict) -> set[str]:
-    """Extract all tool_call IDs from an assistant message's content blocks."""
-    msg = obj.get("message", {})
-    content = msg.get("content", [])
+def extract_tool_call_ids(entry: Entry) -> set[str]:
+    """Extract all tool_call IDs from an assistant entry's content blocks."""
+    content = entry.content
     if not isinstance(content, list):
         return set()
     ids = set()
@@ -136,70 +274,36 @@ def extract_tool_call_ids(obj: dict) -> set[str]:
     return ids
 
 
-def extract_all_tool_call_ids(entries: list) -> set[str]:
-    """Extract all valid tool_call IDs from all non-error assistant messages."""
-    ids = set()
-    for _, obj, _ in entries:
-        if obj is None:
-            continue
-        role = get_role(obj)
-        if role != "assistant":
-            continue
-        msg = obj.get("message", {})
-        if msg.get("stopReason") == "error":
-            continue
-        ids |= extract_tool_call_ids(obj)
-    return ids
-
-
-def has_partial_json(obj: dict) -> bool:
-    """Check if any tool_call block in the assistant message has partialJson."""
-    msg = obj.get("message", {})
-    content = msg.get("content", [])
+def has_partial_json(entry: Entry) -> bool:
+    """Check if any tool_call block in the assistant entry has partialJson."""
+    # Bytes-level gate: no "partialJson" token in the raw line means no block
+    # can carry one — skips the content walk for the overwhelming majority
+    if b'"partialJson"' not in entry.raw:
+        return False
+    content = entry.content
     if not isinstance(content, list):
         return False
-    for block in content:
-        if not isinstance(block, dict):
-            continue
-        if block.get("type") in TOOL_CALL_TYPES and "partialJson" in block:
-            return True
-    return False
-
-
-def is_error_assistant(obj: dict) -> bool:
-    """Check if this assistant message errored (any error type)."""
-    msg = obj.get("message", {})
-    return msg.get("stopReason") == "error"
+    return any(
+        isinstance(block, dict)
+        and block.get("type") in TOOL_CALL_TYPES
+        and "partialJson" in block
+        for block in content
+    )
 
 
-def is_empty_error_assistant(obj: dict) -> bool:
+def is_empty_error_assistant(entry: Entry) -> bool:
     """Check if this is an empty assistant response that recorded an API error."""
-    msg = obj.get("message", {})
-    if msg.get("role") != "assistant":
+    if entry.role != "assistant":
         return False
-    content = msg.get("content", [])
-    err = msg.get("errorMessage", "")
-    return (content == [] or content is None) and "tool_use_id" in err
-
+    return (entry.content == [] or entry.content is None) and "tool_use_id" in entry.err
 
-def get_tool_result_id(obj: dict) -> str | None:
-    """Extract the toolCallId from a toolResult message."""
-    msg = obj.get("message", {})
-    if msg.get("role") not in TOOL_RESULT_ROLES:
-        return None
-    return msg.get("toolCallId") or msg.get("toolUseId") or None
 
-
-def get_tool_result_ids_from_user(obj: dict) -> set[str]:
-    """Extract tool_result tool_use_ids from a user message's content blocks."""
-    msg = obj.get("message", {})
-    if msg.get("role") != "user":
-        return set()
-    content = msg.get("content", [])
-    if not isinstance(content, list):
+def get_tool_result_ids_from_user(entry: Entry) -> set[str]:
+    """Extract tool_result tool_use_ids from a user entry's content blocks."""
+    if entry.role != "user" or not isinstance(entry.content, list):
         return set()
     ids = set()
-    for block in content:
+    for block in entry.content:
         if not isinstance(block, dict):
             continue
         if block.get("type") == "tool_result":
@@ -211,74 +315,77 @@ def get_tool_result_ids_from_user(obj: dict) -> set[str]:
 
 # ── Core Analysis ─────────────────────────────────────────────────────────────
 
-def analyze_session(filepath: str, verbose: bool = False) -> dict:
+def analyze_session(filepath: str, verbose: bool = False,
+                    entries: list[Entry] | None = None) -> dict:
     """
     Analyze a session file for corruption patterns.
-    Returns a report dict.
+    Returns a report dict. Pass `entries` to analyze an already-parsed
+    transcript (e.g. the post-fix verification) without re-reading the file.
     """
-    entries = parse_jsonl(filepath)
+    if entries is None:
+        entries = parse_jsonl(filepath)
     if not entries:
         return {"file": filepath, "lines": 0, "corrupted": False}
 
-    # Track unparseable lines
+    # Single fused pass over all entries. The old four-pass structure walked
+    # the (potentially huge) entries list once per corruption pattern; one
+    # loop dispatching on role does the same classification with a quarter of
+    # the dict lookups. Only cascade-error and orphan-toolResult matching
+    # needs broken_tool_call_ids complete, so those candidates are buffered
+    # and resolved in small follow-up passes after the main loop.
     unparseable_lines = []
-    for lineno, obj, raw in entries:
-        if obj is None:
-            unparseable_lines.append(lineno)
-
-    # Pass 1: Find broken assistant messages (error + partialJson)
     broken_assistant_ids = set()
     broken_tool_call_ids = set()
     broken_line_map = {}
     reasons = {}  # id -> reason string
+    id_to_parent = {}
+    all_valid_tool_call_ids = set()
+    empty_error_candidates = []  # (lineno, oid, errorMessage)
+    tool_result_candidates = []  # (lineno, oid, tool_call_id)
 
-    for lineno, obj, _ in entries:
-        if obj is None:
+    for entry in entries:
+        if entry.obj is None:
+            unparseable_lines.append(entry.lineno)
             continue
-        role = get_role(obj)
-        if role != "assistant":
+
+        oid = entry.oid
+        id_to_parent[oid] = entry.parent
+
+        if entry.role == "assistant":
+            if entry.stop == "error":
+                if has_partial_json(entry):
+                    broken_assistant_ids.add(oid)
+                    broken_line_map[oid] = entry.lineno
+                    broken_tool_call_ids |= extract_tool_call_ids(entry)
+                    reasons[oid] = f"error+partialJson: {entry.err[:80]}"
+            else:
+                all_valid_tool_call_ids |= extract_tool_call_ids(entry)
+            if oid not in broken_assistant_ids and is_empty_error_assistant(entry):
+                empty_error_candidates.append((entry.lineno, oid, entry.err))
             continue
-        if is_error_assistant(obj) and has_partial_json(obj):
-            oid = get_id(obj)
-            broken_assistant_ids.add(oid)
-            broken_line_map[oid] = lineno
-            broken_tool_call_ids |= extract_tool_call_ids(obj)
-            err = obj.get("message", {}).get("errorMessage", "")[:80]
-            reasons[oid] = f"error+partialJson: {err}"
 
-    # Pass 2: Find orphan synthetic toolResults referencing broken tool_call IDs
+        if entry.tool_result_id:
+            tool_result_candidates.append((entry.lineno, oid, entry.tool_result_id))
+
+    # Resolve orphan synthetic toolResults now that broken_tool_call_ids is
+    # complete (a toolResult can precede the assistant that poisoned it)
     orphan_result_ids = set()
-    for lineno, obj, _ in entries:
-        if obj is None:
-            continue
-        tr_id = get_tool_result_id(obj)
-        if tr_id and tr_id in broken_tool_call_ids:
-            oid = get_id(obj)
+    for lineno, oid, tr_id in tool_result_candidates:
+        if tr_id in broken_tool_call_ids:
             orphan_result_ids.add(oid)
             broken_line_map[oid] = lineno
             reasons[oid] = f"orphan toolResult for {tr_id}"
 
-    # Pass 3: Find empty error assistant responses caused by the cascade
+    # Resolve cascade errors: empty assistant responses whose errorMessage
+    # references a poisoned tool_use_id
     cascade_error_ids = set()
-    for lineno, obj, _ in entries:
-        if obj is None:
-            continue
-        if is_empty_error_assistant(obj):
-            err = obj.get("message", {}).get("errorMessage", "")
-            for tc_id in broken_tool_call_ids:
-                if tc_id in err:
-                    oid = get_id(obj)
-                    cascade_error_ids.add(oid)
-                    broken_line_map[oid] = lineno
-                    reasons[oid] = f"cascade 400 referencing {tc_id}"
-                    break
-
-    # Pass 4: Find orphan tool_result blocks in user messages
-    # (tool_result references a tool_use_id that has no corresponding tool_use
-    #  in any valid assistant message)
-    all_valid_tool_call_ids = extract_all_tool_call_ids(entries)
-    # Also include tool_call_ids from broken messages (they'll be removed, but
-    # their orphan results are handled in pass 2)
+    match_broken_id = make_id_matcher(broken_tool_call_ids)
+    for lineno, oid, err in empty_error_candidates:
+        tc_id = match_broken_id(err)
+        if tc_id:
+            cascade_error_ids.add(oid)
+            broken_line_map[oid] = lineno
+            reasons[oid] = f"cascade 400 referencing {tc_id}"
 
     remove_ids = broken_assistant_ids | orphan_result_ids | cascade_error_ids
 
@@ -289,24 +396,31 @@ def analyze_session(filepath: str, verbose: bool = False) -> dict:
             "corrupted": False,
         }
 
-    # Build parent remap: for each removed node, find what should replace it
-    # in the parentId chain
-    id_to_parent = {}
-    for _, obj, _ in entries:
-        if obj is None:
-            continue
-        id_to_parent[get_id(obj)] = get_parent_id(obj)
-
+    # Build parent remap: for each removed node, find the nearest surviving
+    # ancestor. Path compression (union-find style) records the answer for
+    # every node on the walked chain, so long runs of removed entries resolve
+    # in amortized near-constant time instead of O(depth) per node.
     parent_fixes = {}
+
+    def _find(rid: str) -> str:
+        chain = []
+        node = rid
+        while node in remove_ids:
+            if node in parent_fixes:
+                node = parent_fixes[node]
+                break
+            if node in chain:
+                node = ""  # cycle — orphan the subtree to the root
+                break
+            chain.append(node)
+            node = id_to_parent.get(node, "")
+        for walked in chain:
+            parent_fixes[walked] = node
+        return node
+
     for rid in remove_ids:
-        ancestor = id_to_parent.get(rid, "")
-        seen = {rid}
-        while ancestor in remove_ids:
-            if ancestor in seen:
-                break  # cycle guard
-            seen.add(ancestor)
-            ancestor = id_to_parent.get(ancestor, "")
-        parent_fixes[rid] = ancestor
+        if rid not in parent_fixes:
+            _find(rid)
 
     return {
         "file": filepath,
@@ -325,8 +439,64 @@ def analyze_session(filepath: str, verbose: bool = False) -> dict:
     }
 
 
+def analyze_session_cached(filepath: str, verbose: bool = False) -> dict:
+    """analyze_session with a disk cache keyed by the file's mtime+size.
+
+    A --fix rewrites the file and therefore its mtime, invalidating the
+    cached report automatically. Cache failures of any kind fall back to a
+    fresh analysis; writing the cache is best-effort.
+    """
+    cache_path = None
+    key = None
+    try:
+        st = os.stat(filepath)
+        key = (CACHE_SCHEMA, st.st_mtime_ns, st.st_size)
+        digest = hashlib.sha1(filepath.encode("utf-8")).hexdigest()
+        cache_path = REPORT_CACHE_DIR / f"{digest}.pkl"
+        if cache_path.exists():
+            with open(cache_path, "rb") as f:
+                cached_key, report = pickle.load(f)
+            if cached_key == key:
+                return report
+    except (OSError, pickle.PickleError, ValueError, EOFError):
+        pass
+
+    report = analyze_session(filepath, verbose=verbose)
+
+    if cache_path is not None:
+        try:
+            REPORT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            with open(cache_path, "wb") as f:
+                pickle.dump((key, report), f, protocol=5)
+        except OSError:
+            pass
+    return report
+
+
 # ── Fix ───────────────────────────────────────────────────────────────────────
 
+def backup_file(filepath: str, backup: str) -> None:
+    """Create a backup without copying bytes when the filesystem allows it.
+
+    The repaired transcript is written to a fresh file and os.replace()d into
+    place, so the original inode is never modified — a hardlink is a safe O(1)
+    backup. Fall back to a reflink clone (btrfs/xfs) and finally to a full
+    copy. Backups share the inode with the original until the fix lands.
+    """
+    try:
+        os.link(filepath, backup)
+        return
+    except OSError:
+        pass
+    try:
+        subprocess.run(["cp", "--reflink=auto", filepath, backup], check=True,
+                       capture_output=True)
+        return
+    except Exception:
+        pass
+    shutil.copy2(filepath, backup)
+
+
 def fix_session(filepath: str, report: dict, dry_run: bool = True,
                 verbose: bool = False) -> str:
     """Apply the fix to a session file. Returns summary string."""
@@ -370,40 +540,64 @@ def fix_session(filepath: str, report: dict, dry_run: bool = True,
     # Create backup
     ts = datetime.now().strftime("%Y%m%d_%H%M%S")
     backup = f"{filepath}.backup-{ts}"
-    shutil.copy2(filepath, backup)
-
-    # Read, filter, fix, write
-    entries = parse_jsonl(filepath)
-    output = []
+    backup_file(filepath, backup)
+
+    # Stream: read, filter, fix, write to a temp file, atomically replace.
+    # Building the full output list (plus the joined string) doubled peak
+    # memory on large transcripts; writing incrementally keeps one line in
+    # flight at a time.
+    tmp = filepath + ".tmp"
+    kept = 0
     removed = 0
     fixed = 0
 
-    for _, obj, raw in entries:
-        if obj is None:
-            output.append(raw)
-            continue
-
-        oid = get_id(obj)
-
-        # Skip lines marked for removal
-        if oid in remove_ids:
-            removed += 1
-            continue
+    loads = orjson.loads if orjson else json.loads
+    kept_entries = []  # retained for the in-memory verification pass
 
-        # Fix parent references
-        pid = get_parent_id(obj)
-        if pid in parent_fixes:
-            obj["parentId"] = parent_fixes[pid]
-            fixed += 1
-            output.append(json.dumps(obj, ensure_ascii=False))
-        else:
-            output.append(raw)
+    with open(tmp, "wb") as out:
+        for entry in _iter_parsed(filepath):
+            if entry.obj is None:
+                out.write(entry.raw)
+                out.write(b"\n")
+                kept += 1
+                kept_entries.append(entry)
+                continue
 
-    with open(filepath, "w", encoding="utf-8") as f:
-        f.write("\n".join(output) + "\n")
+            # Skip lines marked for removal (pre-filtered clean lines can
+            # never be in remove_ids — corruption markers always parse)
+            if entry.oid in remove_ids:
+                removed += 1
+                continue
 
-    # Verification pass
-    verify_report = analyze_session(filepath)
+            # Fix parent references; clean-skipped lines are parsed lazily
+            # only when they actually need rewriting
+            if entry.parent in parent_fixes:
+                if entry.obj is _SKIP:
+                    try:
+                        entry.obj = loads(entry.raw)
+                    except ValueError:
+                        out.write(entry.raw)
+                        out.write(b"\n")
+                        kept += 1
+                        continue
+                entry.obj["parentId"] = parent_fixes[entry.parent]
+                entry.parent = entry.obj["parentId"]
+                fixed += 1
+                if orjson is not None:
+                    out.write(orjson.dumps(entry.obj))
+                else:
+                    out.write(json.dumps(entry.obj, ensure_ascii=False).encode("utf-8"))
+            else:
+                out.write(entry.raw)
+            out.write(b"\n")
+            kept += 1
+            kept_entries.append(entry)
+
+    os.replace(tmp, filepath)
+
+    # Verification pass — reuse the entries we just wrote instead of
+    # re-reading and re-parsing the whole file from disk
+    verify_report = analyze_session(filepath, entries=kept_entries)
     verified = not verify_report.get("corrupted", False)
 
     summary = [
@@ -411,7 +605,7 @@ def fix_session(filepath: str, report: dict, dry_run: bool = True,
         f"    Backup: {backup}",
         f"    Removed {removed} corrupted lines: {lines_info}",
         f"    Fixed {fixed} parent references",
-        f"    Lines: {report['lines']} -> {len(output)}",
+        f"    Lines: {report['lines']} -> {kept}",
         f"    Verified: {'CLEAN' if verified else 'STILL CORRUPTED (may need another pass)'}",
     ]
     return "\n".join(summary)
@@ -430,12 +624,56 @@ def discover_session_files(all_agents: bool = False) -> list[str]:
 
 # ── Main ──────────────────────────────────────────────────────────────────────
 
+def scan_sessions(files: list[str], verbose: bool = False,
+                  jobs: int | None = None) -> dict[str, dict]:
+    """Analyze all session files, in parallel when there is more than one.
+
+    Sessions are independent (pure I/O + JSON parsing), so scanning is
+    embarrassingly parallel across a process pool. A single file skips the
+    pool entirely to avoid fork overhead.
+    """
+    reports = {}
+    if len(files) <= 1:
+        for filepath in files:
+            try:
+                reports[filepath] = analyze_session_cached(filepath, verbose=verbose)
+            except Exception as e:
+                print(f"  ERROR scanning {filepath}: {e}", file=sys.stderr)
+        return reports
+
+    with ProcessPoolExecutor(max_workers=jobs or os.cpu_count()) as ex:
+        futures = {ex.submit(analyze_session_cached, fp, verbose): fp for fp in files}
+        for fut in as_completed(futures):
+            filepath = futures[fut]
+            try:
+                reports[filepath] = fut.result()
+            except Exception as e:
+                print(f"  ERROR scanning {filepath}: {e}", file=sys.stderr)
+    return reports
+
+
 def main():
     args = sys.argv[1:]
     do_fix = "--fix" in args
     verbose = "--verbose" in args or "-v" in args
     all_agents = "--all-agents" in args
-    positional = [a for a in args if not a.startswith("--") and not a.startswith("-")]
+
+    jobs = None
+    jobs_value = None
+    if "--jobs" in args:
+        idx = args.index("--jobs")
+        if idx + 1 < len(args):
+            jobs_value = args[idx + 1]
+            try:
+                jobs = int(jobs_value)
+            except ValueError:
+                print(f"ERROR: --jobs expects a number, got {jobs_value}",
+                      file=sys.stderr)
+                sys.exit(1)
+
+    positional = [a for a in args
+                  if not a.startswith("--") and not a.startswith("-")
+                  and a != jobs_value]
 
     # Determine which files to scan
     if positional:
@@ -461,12 +699,12 @@ def main():
     print(f"OpenClaw Session Repair — {mode}")
     print(f"Scanning {len(files)} session file(s)...\n")
 
+    reports = scan_sessions(files, verbose=verbose, jobs=jobs)
+
     corrupted_count = 0
     for filepath in files:
-        try:
-            report = analyze_session(filepath, verbose=verbose)
-        except Exception as e:
-            print(f"  ERROR scanning {filepath}: {e}", file=sys.stderr)
+        report = reports.get(filepath)
+        if report is None:
             continue
 
         if report.get("corrupted"):